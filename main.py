@@ -2,23 +2,119 @@
 
 from __future__ import annotations
 
+import json
+import multiprocessing
+import os
 import tkinter
 from abc import abstractmethod
-from concurrent.futures import Future, ThreadPoolExecutor
-from functools import partial
-from mimetypes import guess_type
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
-from random import randint, shuffle
-from threading import Event
+from random import randint
+from threading import Event, Lock
 from tkinter import filedialog, messagebox
 from traceback import print_exception
 from typing import Any, Self
 
 import mutagen
 import pyaudio
+import soundfile
 from pyaudio import PyAudio
 from pydub import AudioSegment
 
+AUDIO_SUFFIXES = frozenset({
+  ".aac",
+  ".aif",
+  ".aiff",
+  ".flac",
+  ".m4a",
+  ".mp3",
+  ".oga",
+  ".ogg",
+  ".opus",
+  ".wav",
+  ".wma",
+})
+SOUNDFILE_SUFFIXES = frozenset({".aif", ".aiff", ".flac", ".ogg", ".wav"})
+FORMAT_FOR_WIDTH = {1: pyaudio.paInt8, 2: pyaudio.paInt16, 3: pyaudio.paInt24, 4: pyaudio.paInt32}
+MAX_SELECTOR_OPTIONS = 50
+METADATA_CACHE_PATH = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "music-test" / "meta.json"
+
+
+def load_metadata_cache() -> dict[str, list[Any]]:
+  """Load cached metadata, mapping path to its mtime, size and titles."""
+  try:
+    with METADATA_CACHE_PATH.open(encoding="utf-8") as file:
+      return json.load(file)
+  except (OSError, ValueError):
+    return {}
+
+
+def save_metadata_cache(metadata_cache: dict[str, list[Any]]) -> None:
+  """Write cached metadata back to disk."""
+  METADATA_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+  temporary = METADATA_CACHE_PATH.with_suffix(".tmp")
+  with temporary.open("w", encoding="utf-8") as file:
+    json.dump(metadata_cache, file, ensure_ascii=False)
+  temporary.replace(METADATA_CACHE_PATH)
+
+
+def titles_for(path: Path, metadata_cache: dict[str, list[Any]]) -> list[str] | None:
+  """Get titles from metadata of a file, parsing it only if changed since last time.
+
+  None is returned if the file can't be read at all, e.g. a dangling symlink.
+  """
+  try:
+    stat = path.stat()
+  except OSError as error:
+    print_exception(error)
+    return None
+  cached = metadata_cache.get(str(path))
+  if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+    return cached[2]
+  try:
+    metadata = mutagen.File(path)
+  except mutagen.MutagenError as error:
+    print_exception(error)
+    metadata = None  # still playable maybe, just without names from metadata
+  titles = [str(title) for title in metadata["Title"]] if metadata is not None and "Title" in metadata else []
+  metadata_cache[str(path)] = [stat.st_mtime_ns, stat.st_size, titles]
+  return titles
+
+
+@dataclass(frozen=True)
+class PCMTrack:
+  """Decoded audio, or a part of it sharing memory with the whole."""
+
+  raw_data: bytes | memoryview
+  channels: int
+  sample_width: int
+  frame_rate: int
+
+  @property
+  def frame_width(self) -> int:
+    return self.channels * self.sample_width
+
+  def __len__(self) -> int:
+    """Length in milliseconds, same as AudioSegment."""
+    return len(self.raw_data) // self.frame_width * 1000 // self.frame_rate
+
+
+def decode(path: Path) -> PCMTrack:
+  """Decode an audio file, reading it directly with libsndfile if possible instead of going through ffmpeg."""
+  if path.suffix.lower() in SOUNDFILE_SUFFIXES:
+    try:
+      data, frame_rate = soundfile.read(path, dtype="int16", always_2d=True)
+    except RuntimeError:
+      pass  # not something libsndfile understands, though suffix looks like
+    else:
+      return PCMTrack(data.tobytes(), data.shape[1], 2, frame_rate)
+  segment = AudioSegment.from_file(path)
+  return PCMTrack(segment.raw_data, segment.channels, segment.sample_width, segment.frame_rate)
+
 
 class Form:
   """Base class of forms to be shown on window."""
@@ -45,7 +141,7 @@ class StartPage(Form):
     # path selector
     self._selector = tkinter.Button(
       text="Select Directory",
-      command=partial(StartPage.select_directory, self),
+      command=self.select_directory,
     )
     self._path_view = tkinter.Label()
     self._path = None
@@ -58,7 +154,7 @@ class StartPage(Form):
         text=f"{i} seconds",
         variable=self._difficulty_variable,
         value=f"{i}",
-        command=partial(StartPage.update_difficulty, self),
+        command=self.update_difficulty,
       )
       for i in ["0.5", "1", "2", "3", "5"]
     ]
@@ -99,6 +195,8 @@ class StartPage(Form):
     for radio in self._radio:
       radio.pack(in_=self._frame, anchor="w")
     self._randomize_checkbox.pack(in_=window.window)
+    if self._path:
+      self._start.pack(in_=window.window, pady=20)
 
     def start_game() -> None:
       self.unload(window)
@@ -109,94 +207,211 @@ class StartPage(Form):
 
   def unload(self, window: Window) -> None:
     super().unload(window)
-    self._selector.destroy()
-    self._path_view.destroy()
-    self._frame.destroy()
-    self._randomize_checkbox.destroy()
-    self._start.destroy()
+    self._selector.pack_forget()
+    self._path_view.pack_forget()
+    self._frame.pack_forget()
+    self._randomize_checkbox.pack_forget()
+    self._start.pack_forget()
 
 
 class Game(Form):
   """Main game form."""
 
+  # widgets are created by the first game, and reused by later ones
+  _constructed = False
+
   def __init__(self, path: Path, time: float, *, randomize: bool) -> Self:
     """Load data from last stage and init components need."""
     super().__init__()
+    if not Game._constructed:
+      Game._construct()
     self._path = path
     self._time = time
     self._randomize = randomize
 
-    self._play = tkinter.Button(text="play")
-    self._continue = tkinter.Button(text="continue")
-    self._next = tkinter.Button(text="next")
-
     self._current_index = 0
     self._correct = 0
 
-    self._status = tkinter.Label()
-
-    self._audio_data = None
+    self._audio_data: PCMTrack | None = None
+    self._decode_futures: dict[Path, Future] = {}
     self._playing: Future | None = None
     self._player_stopper: Event | None = None
+    self._active_stream: pyaudio.Stream | None = None
+    self._stream_cache: dict[tuple[int, int, int], pyaudio.Stream] = {}
+    self._stream_lock = Lock()
     self._finalized = False
-    self._answer_display = tkinter.Label()
 
     self._audio_server = PyAudio()
-    self._thread_pool = ThreadPoolExecutor()
+    self._thread_pool: ThreadPoolExecutor | None = None  # shared one from window
 
     self._window = None  # we need window to terminate
 
     # load music from the directory specified
-    #  this may take some time, but seems that we have to wait
-    self._musics = []
-    for base, _, files in path.walk():
+    #  this may take some time, so do it in background and start with musics found so far
+    #  musics are kept in the order found, as parallel lists
+    self._paths: list[Path] = []
+    self._display_names: list[str] = []
+    self._order: list[int] = []  # indices of musics, in the order to be played
+    self._candidates: dict[str, str] = {}  # distinct display names, to their casefolded form
+    self._filter_after_id: str | None = None
+    self._scanned = False
+    self._waiting = False  # current music is not found yet
+    self._input_trace: str | None = None
+
+  @classmethod
+  def _construct(cls) -> None:
+    cls._play = tkinter.Button(text="play")
+    cls._continue = tkinter.Button(text="continue")
+    cls._next = tkinter.Button(text="next")
+    cls._status = tkinter.Label()
+    cls._answer_display = tkinter.Label()
+    cls._scanning = tkinter.Label(text="Scanning…")
+    cls._answer = tkinter.StringVar()
+    cls._answer_selector = tkinter.OptionMenu(None, cls._answer, "")
+    cls._input_variable = tkinter.StringVar()
+    cls._input = tkinter.Entry(textvariable=cls._input_variable)
+    cls._confirm = tkinter.Button(text="confirm")
+    cls._constructed = True
+
+  def _audio_paths(self) -> Iterator[Path]:
+    for base, _, files in self._path.walk():
       for file in files:
         full_path = base / file
-        mime_type, _ = guess_type(full_path)
-        if mime_type is not None and mime_type.startswith("audio/"):
-          # save the full path and collect possible name from filename and metadata
-          information = {
-            "path": full_path,
-            "names": [full_path.stem],
-          }
-          metadata = mutagen.File(full_path)
-          if "Title" in metadata:
-            information["names"].extend(metadata["Title"])
-          self._musics.append(information)
-    self._candidates = [self._get_display_name(music) for music in self._musics]
-    self._answer = tkinter.StringVar()
-    self._answer_selector = tkinter.OptionMenu(
-      None,
-      self._answer,
-      *self._candidates,
-    )
-    self._input_variable = tkinter.StringVar()
-    self._input = tkinter.Entry(textvariable=self._input_variable)
-    self._confirm = tkinter.Button(text="confirm")
-    shuffle(self._musics)
+        if full_path.suffix.lower() in AUDIO_SUFFIXES:
+          yield full_path
+
+  def _scan(self) -> Iterator[tuple[Path, str]]:
+    """Yield musics under the directory one by one, reading metadata of many files concurrently."""
+    # loaded here rather than at import, so decode workers importing this module don't read it
+    metadata_cache = load_metadata_cache()
+    # metadata reading is mostly waiting for disk, so use much more threads than cores
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    try:
+      with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        paths = self._audio_paths()
+        pending: deque[tuple[Path, Future]] = deque()
+        try:
+          while True:
+            # keep walking while reads are in flight, across directories, but hand out musics in the order found
+            for full_path in islice(paths, max_workers * 2 - len(pending)):
+              pending.append((full_path, executor.submit(titles_for, full_path, metadata_cache)))
+            if not pending:
+              break
+            full_path, task = pending.popleft()
+            titles = task.result()
+            if titles is None:
+              continue  # unreadable, skip it but keep going
+            # save the full path and collect possible name from filename and metadata
+            yield full_path, self._get_display_name([full_path.stem, *titles])
+        finally:
+          for _, task in pending:
+            task.cancel()  # stopped early, don't read the rest
+    finally:
+      # executor is shut down here, so no thread is still writing to the cache
+      try:
+        save_metadata_cache(metadata_cache)
+      except OSError as error:
+        print_exception(error)
+
+  def _scan_in_background(self, window: Window) -> None:
+    try:
+      for path, display_name in self._scan():
+        if window.form is not self:
+          return  # unloaded, no one needs the rest
+        window.window.after(0, self._append_music, path, display_name)
+    except Exception as error:  # noqa: BLE001
+      print_exception(error)  # nobody waits for this task, so report here
+    finally:
+      window.window.after(0, self._scan_finished)
+
+  def _append_music(self, path: Path, display_name: str) -> None:
+    if self._window is None or self._window.form is not self:
+      return
+    # put it at a random place among musics not reached yet, so the order is still a uniform shuffle
+    #  current one counts as not reached until user plays or answers it, or the first found is always first
+    untouched = self._audio_data is None and not self._finalized
+    first = min(self._current_index + (0 if untouched else 1), len(self._order))
+    position = randint(first, len(self._order))  # noqa: S311
+    self._order.insert(position, len(self._paths))
+    self._paths.append(path)
+    self._display_names.append(display_name)
+    if display_name not in self._candidates:
+      # same song may appear many times, and an answer is checked only by its name
+      self._candidates[display_name] = display_name.casefold()
+    # unlike typing, don't postpone a pending refresh, or menu is never filled while scanning
+    if self._filter_after_id is None:
+      self._filter_after_id = self._window.window.after(150, self._filter_selector)
+    if self._waiting:
+      self._resume()
+    else:
+      if position == self._current_index:
+        self.load_data()  # took place of current music
+      self.update_status()
+
+  def _scan_finished(self) -> None:
+    if self._window is None or self._window.form is not self:
+      return
+    self._scanned = True
+    if self._waiting:
+      self._resume()
+
+  def _resume(self) -> None:
+    """Continue after the music waited for is found, or there won't be more."""
+    self._waiting = False
+    self._scanning.pack_forget()
+    if self.load_data():
+      self.update_status()
 
   @staticmethod
-  def _get_display_name(music: dict[str, Any]) -> str:
-    return " or ".join(f'"{name}"' for name in music["names"])
+  def _get_display_name(names: list[str]) -> str:
+    return " or ".join(f'"{name}"' for name in names)
+
+  def _current(self, offset: int = 0) -> int:
+    return self._order[self._current_index + offset]
 
   @property
   def _display_name(self) -> str:
-    return self._get_display_name(self._musics[self._current_index])
+    return self._display_names[self._current()]
 
   def update_status(self) -> None:
     self._status.config(
-      text=f"Progress: {self._current_index + (1 if self._finalized else 0)} / {len(self._musics)}, "
+      text=f"Progress: {self._current_index + (1 if self._finalized else 0)} / {len(self._order)}, "
       f"Succeed: {self._correct} / {self._current_index + (1 if self._finalized else 0)}",
     )
 
   def load_data(self) -> bool:
     self._answer_display.pack_forget()
-    if self._current_index == len(self._musics):
+    if self._current_index == len(self._order):
+      if not self._scanned:
+        self._waiting = True
+        self._scanning.pack(in_=self._window.window)
+        return False
       messagebox.showinfo("Finished!", f"recognized {self._correct} out of {self._current_index} songs")
       self.unload(self._window)
-      self._window.load_form(StartPage())
+      self._window.load_form(self._window.start_page)
       return False
-    self._audio_data = AudioSegment.from_file(self._musics[self._current_index]["path"])
+    # decode in background, and the next music as well, so we are likely ready once user wants to play
+    self._audio_data = None
+    wanted = [self._paths[self._current(offset)] for offset in range(min(2, len(self._order) - self._current_index))]
+    for path in [path for path in self._decode_futures if path not in wanted]:
+      self._decode_futures.pop(path).cancel()  # skipped without playing
+    for path in wanted:
+      self._decode(path)
+    return True
+
+  def _decode(self, path: Path) -> Future:
+    # keyed by path, since musics found later may be inserted before it in play order
+    if path not in self._decode_futures:
+      self._decode_futures[path] = self._window.decode_pool.submit(decode, path)
+    return self._decode_futures[path]
+
+  def _prepare_audio(self) -> None:
+    """Wait for current music to be decoded and pick where to start."""
+    if self._audio_data is not None:
+      return
+    path = self._paths[self._current()]
+    self._audio_data = self._decode(path).result()
+    del self._decode_futures[path]
     length = len(self._audio_data)
     if self._randomize:
       self._start_time = randint(  # noqa: S311
@@ -205,50 +420,86 @@ class Game(Form):
       )
     else:
       self._start_time = length
-    return True
 
-  def play_audio(self, segment: AudioSegment, event: Event) -> None:
-    if segment.sample_width == 1:
-      audio_format = pyaudio.paInt8
-    elif segment.sample_width == 2:
-      audio_format = pyaudio.paInt16
-    elif segment.sample_width == 4:
-      audio_format = pyaudio.paInt32
-    try:
-      stream = self._audio_server.open(
-        format=audio_format,
-        channels=segment.channels,
-        rate=segment.frame_rate,
-        output=True,
-      )
-      raw_data = segment.raw_data
-      for i in range(0, len(raw_data), 1024):
-        stream.write(raw_data[i : i + 1024])
-        if event.is_set():
-          break
+  def _slice_audio(self, start: int, end: int | None = None) -> PCMTrack:
+    """Slice current music by milliseconds without copying."""
+    frame_width = self._audio_data.frame_width
+    bytes_per_second = self._audio_data.frame_rate * frame_width
+    start_byte = int(start / 1000 * bytes_per_second) // frame_width * frame_width
+    end_byte = None if end is None else int(end / 1000 * bytes_per_second) // frame_width * frame_width
+    return PCMTrack(
+      memoryview(self._audio_data.raw_data)[start_byte:end_byte],
+      self._audio_data.channels,
+      self._audio_data.sample_width,
+      self._audio_data.frame_rate,
+    )
 
-      stream.stop_stream()
-      stream.close()
+  def play_audio(self, segment: PCMTrack, event: Event) -> None:
+    try:
+      audio_format = FORMAT_FOR_WIDTH.get(segment.sample_width)
+      if audio_format is None:
+        msg = f"unsupported sample width: {segment.sample_width}"
+        raise ValueError(msg)
+      # opening stream is slow, so keep one for each kind of audio and reuse it
+      key = (audio_format, segment.channels, segment.frame_rate)
+      stream = self._stream_cache.get(key)
+      if stream is None:
+        stream = self._audio_server.open(
+          format=audio_format,
+          channels=segment.channels,
+          rate=segment.frame_rate,
+          output=True,
+          frames_per_buffer=int(segment.frame_rate * 0.1),
+        )
+        self._stream_cache[key] = stream
+      elif stream.is_stopped():
+        stream.start_stream()
+      with self._stream_lock:
+        self._active_stream = stream
+      # write all at once, _stop_playing will abort the stream to interrupt it
+      try:
+        if not event.is_set():
+          stream.write(segment.raw_data)
+      except OSError:
+        if not event.is_set():
+          raise
+      with self._stream_lock:
+        self._active_stream = None
+
+      if not stream.is_stopped():
+        stream.stop_stream()
+    except Exception as error:  # noqa: BLE001
+      print_exception(error)  # nobody waits for this task, so report here
     finally:
       self._playing = None
       self._player_stopper = None
 
+  def _stop_playing(self) -> None:
+    """Interrupt music being played, if any."""
+    stopper = self._player_stopper
+    if stopper is not None:
+      stopper.set()
+    with self._stream_lock:
+      if self._active_stream is not None:
+        self._active_stream.abort()
+
   def _show_answer(self) -> None:
     self._answer_display.config(text=self._display_name)
     self._answer_display.pack(in_=self._window.window)
 
   def play(self) -> None:
-    if self._playing is not None:
+    if self._playing is not None or self._waiting:
       return
+    self._prepare_audio()
     self._player_stopper = Event()
     self._playing = self._thread_pool.submit(
       self.play_audio,
-      self._audio_data[self._start_time : self._start_time + int(self._time * 1000)],
+      self._slice_audio(self._start_time, self._start_time + int(self._time * 1000)),
       self._player_stopper,
     )
 
   def play_continue(self) -> None:
-    if self._playing is not None:
+    if self._playing is not None or self._waiting:
       return
     if not self._finalized:
       self._finalized = True
@@ -256,16 +507,19 @@ class Game(Form):
 
     self.update_status()
 
+    self._prepare_audio()
     self._player_stopper = Event()
     self._playing = self._thread_pool.submit(
       self.play_audio,
-      self._audio_data[self._start_time + int(self._time * 1000) :],
+      self._slice_audio(self._start_time + int(self._time * 1000)),
       self._player_stopper,
     )
 
   def next(self) -> None:
+    if self._waiting:
+      return
     if self._playing is not None:
-      self._player_stopper.set()
+      self._stop_playing()
     if not self._finalized:
       self._finalized = True
       self._show_answer()
@@ -277,16 +531,29 @@ class Game(Form):
     self.update_status()
   
   def _update_selector(self, *args) -> None:
+    # wait until user stops typing for a while, instead of rebuilding menu on every key
+    if self._filter_after_id is not None:
+      self._window.window.after_cancel(self._filter_after_id)
+    self._filter_after_id = self._window.window.after(150, self._filter_selector)
+
+  def _filter_selector(self) -> None:
+    self._filter_after_id = None
     menu = self._answer_selector['menu']
     menu.delete(0, 'end')
 
-    query = self._input_variable.get().strip()
+    query = self._input_variable.get().strip().casefold()
 
-    for option in filter(lambda candidate: query in candidate, self._candidates):
+    # rebuilding menu is the slow part, so only show first few matches
+    options = (
+      candidate
+      for candidate, folded in self._candidates.items()
+      if query in folded
+    )
+    for option in islice(options, MAX_SELECTOR_OPTIONS):
       menu.add_command(label=option, command=lambda value=option: self._answer.set(value))
 
   def submit(self) -> None:
-    if self._finalized:
+    if self._finalized or self._waiting:
       return
     self._finalized = True
     if self._answer.get() == self._display_name:
@@ -297,6 +564,8 @@ class Game(Form):
   def load_to(self, window: Window) -> None:
     super().load_to(window)
     self._window = window
+    self._thread_pool = window.pool
+    self._answer_selector["menu"].delete(0, "end")
     self._status.pack(in_=window.window)
     self._play.pack(in_=window.window)
     self._continue.pack(in_=window.window)
@@ -311,28 +580,43 @@ class Game(Form):
       fill=tkinter.X,
     )
     self._confirm.pack(in_=window.window)
-    self._confirm.config(command=partial(Game.submit, self))
+    self._confirm.config(command=self.submit)
     self._next.pack(in_=window.window)
     self.update_status()
-    self._play.config(command=partial(Game.play, self))
-    self._continue.config(command=partial(Game.play_continue, self))
-    self._next.config(command=partial(Game.next, self))
+    self._play.config(command=self.play)
+    self._continue.config(command=self.play_continue)
+    self._next.config(command=self.next)
     self.load_data()
 
-    self._input_variable.trace("w", partial(Game._update_selector, self))
+    self._input_trace = self._input_variable.trace_add("write", self._update_selector)
+    self._thread_pool.submit(self._scan_in_background, window)
 
   def unload(self, window: Window) -> None:
     super().unload(window)
-    if self._playing is not None:
-      self._player_stopper.set()
-    self._status.destroy()
-    self._play.destroy()
-    self._continue.destroy()
-    self._answer_selector.destroy()
-    self._answer_display.destroy()
-    self._confirm.destroy()
-    self._next.destroy()
-    self._input.destroy()
+    playing = self._playing
+    if playing is not None:
+      self._stop_playing()
+      wait((playing,))  # player thread must be done with streams before they are closed
+    for task in self._decode_futures.values():
+      task.cancel()
+    if self._filter_after_id is not None:
+      window.window.after_cancel(self._filter_after_id)
+    if self._input_trace is not None:
+      self._input_variable.trace_remove("write", self._input_trace)
+    self._input_variable.set("")
+    self._answer.set("")
+    self._scanning.pack_forget()
+    self._status.pack_forget()
+    self._play.pack_forget()
+    self._continue.pack_forget()
+    self._answer_selector.pack_forget()
+    self._answer_display.pack_forget()
+    self._confirm.pack_forget()
+    self._next.pack_forget()
+    self._input.pack_forget()
+    for stream in self._stream_cache.values():
+      stream.close()
+    self._stream_cache.clear()
     self._audio_server.terminate()
 
 
@@ -343,16 +627,24 @@ class Window:
     """Init window of the game."""
     self.window = tkinter.Tk()
     self.window.title("music test")
-    self.window.bind("<Escape>", partial(Window.shutdown, self))
-    self.window.bind("<Control-q>", partial(Window.shutdown, self))
-    self.window.bind("<Control-Q>", partial(Window.shutdown, self))
-    self.window.protocol("WM_DELETE_WINDOW", partial(Window.shutdown, self))
+    self.window.bind("<Escape>", self.shutdown)
+    self.window.bind("<Control-q>", self.shutdown)
+    self.window.bind("<Control-Q>", self.shutdown)
+    self.window.protocol("WM_DELETE_WINDOW", self.shutdown)
 
     self.form = None
+    self.start_page = StartPage()
+    # one thread for playing and one for scanning directory
+    self.pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="music-test")
+    # decoding is CPU bound, use processes for current music and next one
+    #  spawn them, as forking a process with Tk and audio threads running may deadlock the child
+    self.decode_pool = ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn"))
 
   def shutdown(self, _: tkinter.Event | None = None) -> None:
     """Shutdown this game."""
     self.form.unload(self)
+    self.pool.shutdown(wait=False, cancel_futures=True)
+    self.decode_pool.shutdown(wait=False, cancel_futures=True)
     self.window.destroy()
 
   def mainloop(self) -> None:
@@ -364,7 +656,7 @@ class Window:
     form.load_to(self)
 
 
-window = Window()
-start_page = StartPage()
-window.load_form(start_page)
-window.mainloop()
+if __name__ == "__main__":
+  window = Window()
+  window.load_form(window.start_page)
+  window.mainloop()